@@ -1,3 +1,4 @@
+import codecs
 import json
 import falcon
 import logging
@@ -10,6 +11,7 @@ from classification.exceptions import ClassificationError
 from classification.config.constants import Sex, ALLOWED_FILE_EXTENSIONS
 from classification.model import SleepStagesClassifier
 from classification.features.preprocessing import preprocess
+from classification.features.signal import PreprocessedSignal
 
 _logger = logging.getLogger(__name__)
 
@@ -20,8 +22,8 @@ class AnalyzeSleep:
         self.sleep_stage_classifier = SleepStagesClassifier()
 
     @staticmethod
-    def _validate_file(file_content):
-        if file_content is None:
+    def _validate_file(raw_array):
+        if raw_array is None:
             raise ClassificationError("Missing file")
 
     @staticmethod
@@ -32,18 +34,20 @@ class AnalyzeSleep:
     @staticmethod
     def _parse_form(form):
         form_data = {}
-        file_content = None
+        raw_array = None
 
         for part in form:
             if part.name == 'file':
                 AnalyzeSleep._validate_filename(part.filename)
-                file_content = part.stream.read().decode('utf-8')
+                # parsed while it is the current part, as the form drains a part's stream
+                # when moving to the next one, and decoded incrementally while it is parsed
+                raw_array = get_raw_array(codecs.getreader('utf-8')(part.stream))
             else:
                 form_data[part.name] = part.text
 
-        AnalyzeSleep._validate_file(file_content)
+        AnalyzeSleep._validate_file(raw_array)
 
-        return form_data, file_content
+        return form_data, raw_array
 
     def on_post(self, request, response):
         """
@@ -61,8 +65,7 @@ class AnalyzeSleep:
 
         _logger.info("Validating and parsing form fields and EEG file")
         try:
-            form_data, file = self._parse_form(request.get_media())
-            raw_array = get_raw_array(file)
+            form_data, raw_array = self._parse_form(request.get_media())
             classification_request = ClassificationRequest(
                 age=int(form_data['age']),
                 sex=Sex[form_data['sex']],
@@ -82,13 +85,13 @@ class AnalyzeSleep:
             return
 
         _logger.info("Preprocessing of raw EEG data.")
-        preprocessed_epochs = preprocess(classification_request)
+        preprocessed_signal = PreprocessedSignal(preprocess(classification_request))
 
         _logger.info("Prediction of EEG data to sleep stages.")
-        predictions = self.sleep_stage_classifier.predict(preprocessed_epochs, classification_request)
+        predictions = self.sleep_stage_classifier.predict(preprocessed_signal, classification_request)
 
         _logger.info("Computations of visualisation data & of sleep report metrics...")
-        spectrogram_generator = SpectrogramGenerator(preprocessed_epochs)
+        spectrogram_generator = SpectrogramGenerator(preprocessed_signal)
         classification_response = ClassificationResponse(
             classification_request, predictions, spectrogram_generator.generate()
         )
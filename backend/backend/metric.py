@@ -1,18 +1,32 @@
-from collections import Counter
+from functools import cached_property
+
 import numpy as np
 
 from classification.config.constants import SleepStage, EPOCH_DURATION
 
+NB_SLEEP_STAGES = len(SleepStage)
+SLEEP_STAGE_CODES = {stage.name: stage.value for stage in SleepStage}
+# stage names sorted alphabetically along with their codes, to map names to codes with np.searchsorted
+SORTED_SLEEP_STAGE_NAMES = np.array(sorted(SLEEP_STAGE_CODES))
+SORTED_SLEEP_STAGE_CODES = np.array([SLEEP_STAGE_CODES[stage] for stage in SORTED_SLEEP_STAGE_NAMES], dtype=np.int8)
+W_STAGE_CODE = SleepStage.W.value
+REM_STAGE_CODE = SleepStage.REM.value
+# ordered by stage code, as the stage counts are
+SLEEP_STAGE_TIME_KEYS = tuple(f"{SleepStage(code).name.upper()}Time" for code in range(NB_SLEEP_STAGES))
+
 
 class Metrics():
     def __init__(self, sleep_stages, bedtime):
         self.sleep_stages = sleep_stages
         self.bedtime = bedtime
-        self.has_slept = len(np.unique(self.sleep_stages)) != 1 or np.unique(self.sleep_stages)[0] != SleepStage.W.name
+        self._stage_codes = SORTED_SLEEP_STAGE_CODES[np.searchsorted(SORTED_SLEEP_STAGE_NAMES, sleep_stages)]
+        self._stage_counts = np.bincount(self._stage_codes, minlength=NB_SLEEP_STAGES)
 
-        self.is_sleeping_stages = self.sleep_stages != SleepStage.W.name
-        self.sleep_indexes = np.where(self.is_sleeping_stages)[0]
-        self.is_last_stage_sleep = self.sleep_stages[-1] != SleepStage.W.name
+        self.is_sleeping_stages = self._stage_codes != W_STAGE_CODE
+        self.has_slept = bool(self.is_sleeping_stages.any())
+        self._nb_sleep_epochs = int(self.is_sleeping_stages.sum())
+        self._last_sleep_index = self._get_last_index_of_stage(self.is_sleeping_stages)
+        self.is_last_stage_sleep = bool(self.is_sleeping_stages[-1])
 
         self._initialize_sleep_offset()
         self._initialize_sleep_latency()
@@ -21,7 +35,7 @@ class Metrics():
 
     @property
     def report(self):
-        report = {
+        return {
             'sleepOffset': self._sleep_offset,
             'sleepLatency': self._sleep_latency,
             'remLatency': self._rem_latency,
@@ -37,67 +51,55 @@ class Metrics():
             **self._time_passed_in_stage,
         }
 
-        for metric in report:
-            #  json does not recognize NumPy data types
-            if isinstance(report[metric], np.int64):
-                report[metric] = int(report[metric])
-
-        return report
-
-    @property
+    @cached_property
     def _sleep_time(self):
         if not self.has_slept:
             return 0
 
         return self._sleep_offset - self._sleep_onset
 
-    @property
+    @cached_property
     def _wake_after_sleep_onset(self):
         if not self.has_slept:
             return 0
 
         return self._sleep_time - self._efficient_sleep_time
 
-    @property
+    @cached_property
     def _time_passed_in_stage(self):
         """Calculates time passed in each stage for all of the sequence"""
-        nb_epoch_passed_by_stage = Counter(self.sleep_stages)
-
-        def get_time_passed(stage):
-            return EPOCH_DURATION * nb_epoch_passed_by_stage[stage] if stage in nb_epoch_passed_by_stage else 0
-
         return {
-            f"{stage.upper()}Time": get_time_passed(stage)
-            for stage in SleepStage.tolist()
+            time_key: EPOCH_DURATION * nb_epochs
+            for time_key, nb_epochs in zip(SLEEP_STAGE_TIME_KEYS, self._stage_counts.tolist())
         }
 
-    @property
+    @cached_property
     def _sleep_efficiency(self):
-        return len(self.sleep_indexes) / len(self.sleep_stages)
+        return self._nb_sleep_epochs / len(self.sleep_stages)
 
-    @property
+    @cached_property
     def _efficient_sleep_time(self):
-        return len(self.sleep_indexes) * EPOCH_DURATION
+        return self._nb_sleep_epochs * EPOCH_DURATION
 
-    @property
+    @cached_property
     def _wake_after_sleep_offset(self):
         if not self.has_slept:
             return 0
 
         wake_after_sleep_offset_nb_epochs = (
-            len(self.sleep_stages) - self.sleep_indexes[-1] - 1
+            len(self.sleep_stages) - self._last_sleep_index - 1
         ) if not self.is_last_stage_sleep else 0
 
         return wake_after_sleep_offset_nb_epochs * EPOCH_DURATION
 
-    @property
+    @cached_property
     def _sleep_onset(self):
         if not self.has_slept:
             return None
 
         return self._sleep_latency + self.bedtime
 
-    @property
+    @cached_property
     def _rem_onset(self):
         rem_latency = self._rem_latency
         if rem_latency is None:
@@ -107,8 +109,7 @@ class Metrics():
 
     def _initialize_sleep_offset(self):
         if self.has_slept:
-            sleep_nb_epochs = (self.sleep_indexes[-1] + 1) if len(self.sleep_indexes) else len(self.sleep_stages)
-            sleep_offset = sleep_nb_epochs * EPOCH_DURATION + self.bedtime
+            sleep_offset = (self._last_sleep_index + 1) * EPOCH_DURATION + self.bedtime
         else:
             sleep_offset = None
 
@@ -120,7 +121,7 @@ class Metrics():
     def _initialize_rem_latency(self):
         """Time from the sleep onset to the first epoch of REM sleep"""
         if self.has_slept:
-            bedtime_to_rem_duration = self._get_latency_of_stage(self.sleep_stages == SleepStage.REM.name)
+            bedtime_to_rem_duration = self._get_latency_of_stage(self._stage_codes == REM_STAGE_CODE)
             rem_latency = bedtime_to_rem_duration - self._sleep_latency if bedtime_to_rem_duration is not None else None
         else:
             rem_latency = None
@@ -128,20 +129,12 @@ class Metrics():
         self._rem_latency = rem_latency
 
     def _initialize_transition_based_metrics(self):
-        consecutive_stages_occurences = Counter(zip(self.sleep_stages[:-1], self.sleep_stages[1:]))
-        occurences_by_transition = {
-            consecutive_stages: consecutive_stages_occurences[consecutive_stages]
-            for consecutive_stages in consecutive_stages_occurences if consecutive_stages[0] != consecutive_stages[1]
-        }
-        transition_occurences = list(occurences_by_transition.values())
-        awakenings_occurences = [
-            occurences_by_transition[transition_stages]
-            for transition_stages in occurences_by_transition
-            if transition_stages[0] != SleepStage.W.name
-            and transition_stages[1] == SleepStage.W.name
-        ]
-        nb_stage_shifts = sum(transition_occurences)
-        nb_awakenings = sum(awakenings_occurences)
+        previous_stages = self._stage_codes[:-1]
+        next_stages = self._stage_codes[1:]
+        is_stage_shift = previous_stages != next_stages
+
+        nb_stage_shifts = int(np.count_nonzero(is_stage_shift))
+        nb_awakenings = int(np.count_nonzero(is_stage_shift & (next_stages == W_STAGE_CODE)))
 
         if self.is_last_stage_sleep and self.has_slept:
             nb_stage_shifts += 1
@@ -151,9 +144,17 @@ class Metrics():
         self._awakenings = nb_awakenings
 
     def _get_latency_of_stage(self, sequence_is_stage):
-        epochs_of_stage_of_interest = np.where(sequence_is_stage)[0]
+        first_epoch_of_stage = np.argmax(sequence_is_stage)
+
+        if not sequence_is_stage[first_epoch_of_stage]:
+            return None
+
+        return int(first_epoch_of_stage) * EPOCH_DURATION
+
+    def _get_last_index_of_stage(self, sequence_is_stage):
+        last_epoch_of_stage = len(sequence_is_stage) - 1 - np.argmax(sequence_is_stage[::-1])
 
-        if len(epochs_of_stage_of_interest) == 0:
+        if not sequence_is_stage[last_epoch_of_stage]:
             return None
 
-        return epochs_of_stage_of_interest[0] * EPOCH_DURATION
+        return int(last_epoch_of_stage)
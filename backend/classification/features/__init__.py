@@ -9,7 +9,7 @@ from classification.features.extraction import (
 def get_features(signal, request):
     """Returns the raw features
     Input:
-    - raw_eeg: instance of mne.io.RawArray
+    - signal: instance of PreprocessedSignal
         Should contain 2 channels (1: FPZ-CZ, 2: PZ-OZ)
     - info: instance of ClassificationRequest
     Returns
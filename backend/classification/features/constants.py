@@ -16,6 +16,9 @@ FREQ_BANDS_RANGE = {
     BETA: [15.5, 30]
 }
 
+PSD_MIN_FREQ = min(freq_range[0] for freq_range in FREQ_BANDS_RANGE.values())
+PSD_MAX_FREQ = max(freq_range[1] for freq_range in FREQ_BANDS_RANGE.values())
+
 FREQ_BANDS_ORDERS = {
     DELTA: 5,
     THETA: 8,
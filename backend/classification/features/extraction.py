@@ -7,12 +7,14 @@ from classification.config.constants import (
 )
 from classification.features.pipeline import get_feature_union
 
+AGE_FEATURE_BINS_UPPER_BOUNDS = np.array([age_range[1] for age_range in AGE_FEATURE_BINS], dtype=np.int32)
 
-def get_eeg_features(epochs, in_bed_seconds, out_of_bed_seconds):
+
+def get_eeg_features(signal, in_bed_seconds, out_of_bed_seconds):
     """Returns the continuous feature matrix
     Input
     -------
-    epochs: mne.Epochs object with signals with or without annotations
+    signal: PreprocessedSignal of epochs with or without annotations
     in_bed_seconds: timespan, in seconds, from which the subject started
         the recording and went to bed
     out_of_bed_seconds: timespan, in seconds, from which the subject
@@ -22,16 +24,22 @@ def get_eeg_features(epochs, in_bed_seconds, out_of_bed_seconds):
     -------
     Array of size (nb_epochs, nb_continuous_features)
     """
-    features = []
     feature_union = get_feature_union()
+    # (nb_epochs, nb_channels, nb_samples_per_epoch), which is only copied once
+    data = signal.epochs.get_data()
+    features = [feature_union.transform(signal.pick_channel(channel, data)) for channel in EEG_CHANNELS]
 
-    for channel in EEG_CHANNELS:
-        channel_epochs = epochs.copy().pick_channels({channel})
-        channel_features = feature_union.transform(channel_epochs)
-
-        features.append(channel_features)
+    eeg_features = np.empty(
+        (features[0].shape[0], sum(channel_features.shape[1] for channel_features in features)),
+        dtype=features[0].dtype,
+    )
+    column_index = 0
+    for channel_features in features:
+        nb_channel_features = channel_features.shape[1]
+        eeg_features[:, column_index:column_index + nb_channel_features] = channel_features
+        column_index += nb_channel_features
 
-    return np.hstack(tuple(features))
+    return eeg_features
 
 
 def get_non_eeg_features(age, sex, nb_epochs):
@@ -47,11 +55,8 @@ def get_non_eeg_features(age, sex, nb_epochs):
     Array of size (nb_epochs,nb_categorical_features), which contains
     (duplicated) value for all epochs because it concerns the same subject.
     """
-    age_category = next(
-        category_index
-        for category_index, age_range in enumerate(AGE_FEATURE_BINS)
-        if age >= age_range[0] and age <= age_range[1]
-    )
-    X_categorical = [sex.value, age_category]
+    age_category = int(np.searchsorted(AGE_FEATURE_BINS_UPPER_BOUNDS, age))
+    X_categorical = np.array([sex.value, age_category], dtype=np.int8)
 
-    return np.array(X_categorical * nb_epochs).reshape(nb_epochs, -1)
+    # read-only view, as the categorical features are copied when appended to the continuous ones
+    return np.broadcast_to(X_categorical, (nb_epochs, X_categorical.size))
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from sklearn.pipeline import FeatureUnion
 
 from classification.features.pipeline.time_domain import (
@@ -11,7 +13,9 @@ from classification.features.pipeline.time_subband import (
 )
 
 
+@lru_cache(maxsize=1)
 def get_feature_union():
+    """Returns the feature union, built once as its transformers are stateless"""
     return FeatureUnion([
         ('time_domain', get_time_domain_pipeline()),
         ('frequency_domain', get_frequency_domain_pipeline()),
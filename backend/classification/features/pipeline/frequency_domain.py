@@ -3,7 +3,7 @@ from sklearn.pipeline import FeatureUnion, Pipeline
 from sklearn.preprocessing import FunctionTransformer
 
 from classification.features.pipeline.utils import (
-    get_psds_from_epochs,
+    get_psds_from_signal,
 )
 from classification.features.constants import (
     FREQ_BANDS_RANGE,
@@ -30,7 +30,8 @@ def _get_mean_psds(psds_with_freqs, are_relative=False):
     freqs = psds_with_freqs[1]
 
     if are_relative:
-        psds /= np.sum(psds, axis=-1, keepdims=True)
+        # not in place, as the psds are shared with the other features and the spectrogram
+        psds = psds / np.sum(psds, axis=-1, keepdims=True)
 
     X = []
     for fmin, fmax in FREQ_BANDS_RANGE.values():
@@ -90,8 +91,8 @@ def _get_sefd_on_all_epochs(psds_with_freqs):
 
 
 def get_frequency_domain_pipeline():
-    get_psds_from_epochs_transformer = FunctionTransformer(
-        get_psds_from_epochs, validate=False)
+    get_psds_from_signal_transformer = FunctionTransformer(
+        get_psds_from_signal, validate=False)
     absolute_mean_psds_transformer = FunctionTransformer(
         _get_mean_psds, validate=False)
     relative_mean_psds_transformer = FunctionTransformer(
@@ -104,7 +105,7 @@ def get_frequency_domain_pipeline():
         _get_sefd_on_all_epochs, validate=False)
 
     return Pipeline([
-        ('get_psds_from_epochs', get_psds_from_epochs_transformer),
+        ('get_psds_from_signal', get_psds_from_signal_transformer),
         ('frequency_domain_features', FeatureUnion([
             ('absolute_mean_power_band', absolute_mean_psds_transformer),
             ('relative_mean_power_band', relative_mean_psds_transformer),
@@ -7,7 +7,7 @@ from sklearn.preprocessing import (FunctionTransformer)
 from classification.features.pipeline.utils import (
     get_transformer,
     get_transformer_list,
-    get_data_from_epochs,
+    get_data_from_signal,
 )
 
 
@@ -75,8 +75,8 @@ def _hjorth(X):
 
 
 def get_time_domain_pipeline():
-    get_data_from_epochs_transformer = FunctionTransformer(
-        get_data_from_epochs, validate=False)
+    get_data_from_signal_transformer = FunctionTransformer(
+        get_data_from_signal, validate=False)
     mean_transformer = FunctionTransformer(
         get_transformer(np.mean), validate=True)
     std_transformer = FunctionTransformer(
@@ -91,7 +91,7 @@ def get_time_domain_pipeline():
         get_transformer_list(_hjorth), validate=True)
 
     return Pipeline([
-        ('epochs_to_data', get_data_from_epochs_transformer),
+        ('signal_to_data', get_data_from_signal_transformer),
         ('time_domain_features', FeatureUnion([
             ('mean', mean_transformer),
             ('std', std_transformer),
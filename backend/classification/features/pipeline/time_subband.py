@@ -38,8 +38,8 @@ def _get_pipeline_per_subband(subband_name: str):
     bounds = [freq / NYQUIST_FREQ for freq in freq_range]
     b, a = butter(order, bounds, btype='bandpass')
 
-    def filter_epochs_in_specified_subband(epochs):
-        return epochs.copy().filter(
+    def filter_epochs_in_specified_subband(signal):
+        return signal.epochs.copy().filter(
             l_freq=bounds[0],
             h_freq=bounds[1],
             method='iir',
@@ -1,4 +1,10 @@
-from mne.time_frequency import psd_welch
+def get_data_from_signal(signal):
+    """
+    signal: PreprocessedSignal
+
+    returns np array of shape (nb_epochs, sampling_rate*epoch_length)
+    """
+    return get_data_from_epochs(signal.epochs)
 
 
 def get_data_from_epochs(epochs):
@@ -10,14 +16,13 @@ def get_data_from_epochs(epochs):
     return epochs.get_data().squeeze()
 
 
-def get_psds_from_epochs(epochs):
-    """Extracts power spectrum densities from epochs
+def get_psds_from_signal(signal):
+    """Extracts power spectrum densities from the signal
     Returns
     --------
     psds with associated frequencies calculated with the welch method.
     """
-    psds, freqs = psd_welch(epochs, fmin=0.5, fmax=30., verbose=False)
-    return psds, freqs
+    return signal.psds_with_freqs
 
 
 def get_transformer(get_feature):
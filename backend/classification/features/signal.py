@@ -0,0 +1,57 @@
+from mne import EpochsArray, pick_info
+from mne.time_frequency import psd_welch
+
+from classification.features.constants import (
+    PSD_MIN_FREQ,
+    PSD_MAX_FREQ,
+)
+
+
+class PreprocessedSignal():
+    """Preprocessed epochs along with their power spectral densities, which are
+    computed once and shared by the feature extraction and the spectrogram
+    Input:
+    - epochs: instance of mne.Epochs
+    - psds_with_freqs: tuple of precomputed psds of the epochs and their
+        frequencies, computed on first access if not provided
+    """
+
+    def __init__(self, epochs, psds_with_freqs=None):
+        self.epochs = epochs
+        self._psds_with_freqs = psds_with_freqs
+
+    @property
+    def psds_with_freqs(self):
+        """Power spectrum densities calculated with the welch method
+        Returns
+        --------
+        tuple of (nb_epochs, nb_channels, nb_freqs) psds and (nb_freqs,) frequencies
+        """
+        if self._psds_with_freqs is None:
+            self._psds_with_freqs = psd_welch(
+                self.epochs,
+                fmin=PSD_MIN_FREQ,
+                fmax=PSD_MAX_FREQ,
+                verbose=False,
+            )
+
+        return self._psds_with_freqs
+
+    def pick_channel(self, channel, data=None):
+        """Returns the signal of a single channel, which shares its data and psds with this signal
+        Input:
+        - channel: name of the channel to pick
+        - data: (nb_epochs, nb_channels, nb_samples_per_epoch) data of the epochs, if already fetched
+        """
+        channel_index = self.epochs.ch_names.index(channel)
+        data = self.epochs.get_data() if data is None else data
+        psds, freqs = self.psds_with_freqs
+
+        channel_epochs = EpochsArray(
+            data[:, channel_index:channel_index + 1, :],
+            pick_info(self.epochs.info, [channel_index]),
+            tmin=self.epochs.tmin,
+            verbose=False,
+        )
+
+        return PreprocessedSignal(channel_epochs, (psds[:, channel_index:channel_index + 1, :], freqs))
@@ -16,16 +16,16 @@ class SleepStagesClassifier():
         self.postprocessor_state = load_hmm()
         self.postprocessor = get_hmm_model(self.postprocessor_state)
 
-    def predict(self, epochs, request):
+    def predict(self, signal, request):
         """
         Input:
-        - raw_eeg: instance of mne.Epochs
+        - signal: instance of PreprocessedSignal
             Should contain 2 channels (1: FPZ-CZ, 2: PZ-OZ)
         - request: instance of ClassificationRequest
         Returns: array of predicted sleep stages
         """
         _logger.info("Extracting features...")
-        features = get_features(epochs, request)
+        features = get_features(signal, request)
         _logger.info(f"Finished extracting {features.shape[1]} features over {features.shape[0]} epochs.")
 
         _logger.info("Classifying sleep stages from extracted features...")
@@ -16,6 +16,8 @@ from mne import create_info
 from mne.io import RawArray
 
 from classification.config.constants import EEG_CHANNELS
+from classification.parser.constants import FILE_HEADER_NB_LINES
+from classification.parser.csv import HeaderPrefixedFile
 from classification.parser.file_type import detect_file_type
 from classification.parser.sample_rate import detect_sample_rate
 
@@ -26,14 +28,15 @@ _logger = logging.getLogger(__name__)
 def get_raw_array(file):
     """Converts a file following a logging format into a mne.RawArray
     Input:
-    - file: received as an input file
+    - file: text file-like object of the received input file, which is read once
     Returns:
     - mne.RawArray of the two EEG channels of interest
     """
+    header = ''.join(file.readline() for _ in range(FILE_HEADER_NB_LINES))
 
-    filetype = detect_file_type(file)
+    filetype = detect_file_type(header)
 
-    sample_rate = detect_sample_rate(file, filetype)
+    sample_rate = detect_sample_rate(header, filetype)
 
     _logger.info(
         f"EEG data has been detected to be in the {filetype.name} format "
@@ -41,7 +44,7 @@ def get_raw_array(file):
     )
 
     _logger.info("Parsing EEG file to a mne.RawArray object...")
-    eeg_raw = filetype.parser(file)
+    eeg_raw = filetype.parser(HeaderPrefixedFile(header, file))
 
     raw_object = RawArray(
         eeg_raw,
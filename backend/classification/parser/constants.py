@@ -9,3 +9,6 @@ SCALE_V_PER_COUNT = SCALE_uV_PER_COUNT * uV_TO_V
 FILE_COLUMN_OFFSET = 1
 
 RETAINED_COLUMNS = tuple(range(FILE_COLUMN_OFFSET, len(EEG_CHANNELS) + 1))
+
+# enough lines to hold the metadata of all supported file types
+FILE_HEADER_NB_LINES = 5
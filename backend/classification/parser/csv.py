@@ -4,9 +4,37 @@ from io import StringIO
 from classification.exceptions import ClassificationError
 
 
-def read_csv(file_content, rows_to_skip=0, columns_to_read=None):
+class HeaderPrefixedFile():
+    """Text file-like object which replays the already read header of a file
+    before reading the rest of it
+    Input:
+    - header: lines already read from the file
+    - file: text file-like object, positioned right after the header
+    """
+
+    def __init__(self, header, file):
+        self.header = StringIO(header)
+        self.file = file
+
+    def read(self, size=-1):
+        content = self.header.read(size)
+
+        if size is None or size < 0:
+            return content + self.file.read()
+
+        if len(content) < size:
+            content += self.file.read(size - len(content))
+
+        return content
+
+    def __iter__(self):
+        yield from self.header
+        yield from self.file
+
+
+def read_csv(file, rows_to_skip=0, columns_to_read=None):
     try:
-        raw_array = pd.read_csv(StringIO(file_content),
+        raw_array = pd.read_csv(file,
                                 skiprows=rows_to_skip,
                                 usecols=columns_to_read
                                 ).to_numpy()
@@ -12,10 +12,10 @@ class FileType(Enum):
         self.parser = parser
 
 
-def detect_file_type(file_content) -> FileType:
+def detect_file_type(file_header) -> FileType:
     """Detects file type
-    - file: received as an input file
+    - file_header: first lines of the input file
     Returns:
     - FileType of the input file
     """
-    return FileType.SessionFile if "EEG Data" in file_content else FileType.SDFile
+    return FileType.SessionFile if "EEG Data" in file_header else FileType.SDFile
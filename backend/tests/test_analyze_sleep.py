@@ -0,0 +1,100 @@
+"""
+Tests the parsing of the EEG file received in the multipart form of an analyze sleep request
+"""
+
+from falcon import App, testing
+
+from tests.setup import pytest_generate_tests  # noqa: F401
+from backend.analyze_sleep import AnalyzeSleep
+from classification.config.constants import EEG_CHANNELS
+
+BOUNDARY = 'polydodo-boundary'
+NB_SAMPLES = 1000
+FORM_FIELDS = {
+    'device': 'CYTON',
+    'sex': 'F',
+    'age': '23',
+    'stream_start': '1602895800000',
+    'bedtime': '1602898320000',
+    'wakeup': '1602931800000',
+}
+
+
+def get_session_file():
+    header = (
+        "%OpenBCI Raw EEG Data\n"
+        "%Number of channels = 8\n"
+        "%Sample Rate = 200 Hz\n"
+        "%Board = OpenBCI_GUI$BoardCytonSerial\n"
+        "Sample Index, EXG Channel 0, EXG Channel 1, Timestamp\n"
+    )
+    samples = ''.join(f"{index % 256}, {index * 0.5}, {-index * 0.5}, 1602895800000\n" for index in range(NB_SAMPLES))
+    return header + samples
+
+
+def get_sd_file():
+    header = (
+        "%STOP AT\n"
+        "%SD log\n"
+    )
+    samples = ''.join(f"{index % 256:02X},{index:05X}A,F{index:05X},AAAAAA\n" for index in range(NB_SAMPLES))
+    return header + samples
+
+
+def get_multipart_body(file_content, filename, is_file_first):
+    file_part = (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: text/plain\r\n\r\n"
+        f"{file_content}\r\n"
+    )
+    field_parts = ''.join(
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+        f"{value}\r\n"
+        for name, value in FORM_FIELDS.items()
+    )
+    parts = file_part + field_parts if is_file_first else field_parts + file_part
+
+    return f"{parts}--{BOUNDARY}--\r\n"
+
+
+FILES = {
+    'session': dict(content=get_session_file(), filename='session.txt', sample_rate=200),
+    'sd': dict(content=get_sd_file(), filename='sd.txt', sample_rate=250),
+}
+
+
+class ParseFormResource():
+    def on_post(self, request, response):
+        self.form_data, self.raw_array = AnalyzeSleep._parse_form(request.get_media())
+
+
+class TestParseForm():
+    """Tests the EEG file is parsed whatever the position of its part in the form"""
+    params = {
+        'test_parse_file': [
+            dict(file_type='session', is_file_first=True),
+            dict(file_type='session', is_file_first=False),
+            dict(file_type='sd', is_file_first=True),
+            dict(file_type='sd', is_file_first=False),
+        ],
+    }
+
+    def test_parse_file(self, file_type, is_file_first):
+        file = FILES[file_type]
+        resource = ParseFormResource()
+        app = App()
+        app.add_route('/analyze-sleep', resource)
+
+        testing.TestClient(app).simulate_post(
+            '/analyze-sleep',
+            body=get_multipart_body(file['content'], file['filename'], is_file_first),
+            content_type=f'multipart/form-data; boundary={BOUNDARY}',
+        )
+
+        assert resource.form_data == FORM_FIELDS
+        assert resource.raw_array.info['sfreq'] == file['sample_rate']
+        assert resource.raw_array.ch_names == EEG_CHANNELS
+        # the first line following the skipped rows is read as the columns header
+        assert resource.raw_array.get_data().shape == (len(EEG_CHANNELS), NB_SAMPLES - 1)
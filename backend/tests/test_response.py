@@ -415,3 +415,23 @@ class TestReportStageShifts():
     def assert_sleep_efficiency(self, sequence, expected_sleep_shifts):
         report = get_report(self.MOCK_REQUEST, sequence)
         assert report['stageShifts'] == expected_sleep_shifts
+
+
+class TestReportTypes():
+    """Tests the report only holds native python types, as it is serialized to json"""
+    params = {
+        'test_report_has_native_types': [
+            dict(sequence=['W', 'W', 'W']),
+            dict(sequence=['N1', 'N2', 'N2']),
+            dict(sequence=['W', 'N1', 'N2', 'N3', 'REM', 'N1', 'W']),
+        ],
+    }
+
+    @classmethod
+    def setup_class(cls):
+        cls.MOCK_REQUEST = get_mock_request()
+
+    def test_report_has_native_types(self, sequence):
+        report = get_report(self.MOCK_REQUEST, sequence)
+        for metric, value in report.items():
+            assert value is None or type(value) in (int, float), f"{metric} is of type {type(value)}"